@@ -34,15 +34,19 @@ impl Config {
     }
 }
 
-/// Factory method for new instance of application route handler.
-pub async fn app(config: Config) -> Router {
+/// Installs the global tracing subscriber. Call once at process start, before [app]. Kept out of
+/// the router factory so that constructing a [Router] has no global side effects.
+pub fn init_tracing() {
     tracing_subscriber::registry()
         .with(tracing_subscriber::EnvFilter::new(
             std::env::var("RUST_LOG").unwrap_or_else(|_| "harbor=debug".into()),
         ))
         .with(tracing_subscriber::fmt::layer())
         .init();
+}
 
+/// Factory method for new instance of application route handler.
+pub async fn app(config: Config) -> Router {
     let api_key = HeaderName::from_static(X_API_KEY);
     let amz_date = HeaderName::from_static(X_AMZ_DATE);
 
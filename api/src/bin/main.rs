@@ -1,10 +1,12 @@
 use harbcore::config::dev_context;
-use harbor_api::app::{app, Config};
+use harbor_api::app::{app, init_tracing, Config};
 use std::net::SocketAddr;
 use tracing::{info, trace};
 
 #[tokio::main]
 async fn main() {
+    init_tracing();
+
     // TODO: Dynamically load config
     let cx = match dev_context(None) {
         Ok(cx) => cx,
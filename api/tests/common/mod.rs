@@ -5,14 +5,13 @@ use axum::{
     Router,
 };
 use harbcore::config::dev_context;
-use harbcore::testing::sbom_fixture_path;
+use harbcore::testing::sbom_raw;
 use harbor_api::app::{app, Config};
 use harbor_api::Error;
 use http::Method;
 
 use platform::persistence::mongodb::{MongoDocument, Store};
 use serde::Serialize;
-use serde_json::json;
 use std::sync::Arc;
 use tower::ServiceExt;
 use uuid::Uuid;
@@ -104,8 +103,8 @@ pub fn request(method: Method, route: &str, body: Option<Body>) -> Request<Body>
 
 #[allow(dead_code)]
 pub fn raw_sbom() -> Result<String, Error> {
-    std::fs::read_to_string(sbom_fixture_path()?)
-        .map_err(|e| Error::InternalServerError(e.to_string()))
+    // Served from the fixture cache so the file is only read once per test binary.
+    Ok(sbom_raw()?)
 }
 
 #[allow(dead_code)]
@@ -113,7 +112,7 @@ pub fn sbom_as_body() -> Result<Body, Error> {
     let raw = raw_sbom()?;
 
     Ok(Body::from(
-        serde_json::to_vec(&json!(raw)).map_err(|e| Error::InternalServerError(e.to_string()))?,
+        serde_json::to_vec(&raw).map_err(|e| Error::InternalServerError(e.to_string()))?,
     ))
 }
 
@@ -23,6 +23,9 @@ pub(crate) async fn execute(args: &AnalyzeArgs) -> Result<(), Error> {
 
     let cx = match &args.debug {
         false => {
+            platform::persistence::s3::Store::prewarm()
+                .await
+                .map_err(|e| Error::Config(e.to_string()))?;
             storage = Arc::new(S3StorageProvider {});
             harbcore::config::harbor_context().map_err(|e| Error::Config(e.to_string()))?
         }
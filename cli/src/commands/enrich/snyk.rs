@@ -34,6 +34,9 @@ pub async fn execute(args: &EnrichArgs) -> Result<(), Error> {
 
     let cx = match &args.debug {
         false => {
+            platform::persistence::s3::Store::prewarm()
+                .await
+                .map_err(|e| Error::Config(e.to_string()))?;
             storage = Box::new(S3StorageProvider {});
             harbcore::config::harbor_context().map_err(|e| Error::Config(e.to_string()))?
         }
@@ -39,6 +39,9 @@ pub(crate) async fn execute(args: &IngestArgs) -> Result<(), Error> {
 
     let cx = match &args.debug {
         false => {
+            platform::persistence::s3::Store::prewarm()
+                .await
+                .map_err(|e| Error::Config(e.to_string()))?;
             storage = Box::new(S3StorageProvider {});
             harbcore::config::harbor_context().map_err(|e| Error::Config(e.to_string()))?
         }
@@ -4,28 +4,28 @@ use platform::encoding::url_encode;
 use platform::persistence::mongodb::Context;
 use serde::{Deserialize, Serialize};
 
-/// Returns the Snyk API token from an environment variable.
-pub fn snyk_token() -> Result<String, Error> {
-    match from_env("SNYK_TOKEN") {
-        None => Err(Error::Config("Snyk token not set".to_string())),
+/// Returns the value of a required environment variable, or a Config error with the specified
+/// message if it is not set.
+fn required_env(key: &str, not_set: &str) -> Result<String, Error> {
+    match from_env(key) {
+        None => Err(Error::Config(not_set.to_string())),
         Some(v) => Ok(v),
     }
 }
 
+/// Returns the Snyk API token from an environment variable.
+pub fn snyk_token() -> Result<String, Error> {
+    required_env("SNYK_TOKEN", "Snyk token not set")
+}
+
 /// Returns the GitHub PAT token from an environment variable.
 pub fn github_pat() -> Result<String, Error> {
-    match from_env("GITHUB_PAT") {
-        None => Err(Error::Config("GITHUB_PAT token not set".to_string())),
-        Some(v) => Ok(v),
-    }
+    required_env("GITHUB_PAT", "GITHUB_PAT token not set")
 }
 
 /// Returns the Harbor S3 bucket name.
 pub fn harbor_bucket() -> Result<String, Error> {
-    match from_env("HARBOR_FILE_STORE") {
-        None => Err(Error::Config("Harbor bucket not set".to_string())),
-        Some(v) => Ok(v),
-    }
+    required_env("HARBOR_FILE_STORE", "Harbor bucket not set")
 }
 
 /// Returns a Mongo Context for used with the local devenv. Used by tests or for local development.
@@ -48,12 +48,7 @@ pub fn dev_context(db_name: Option<&str>) -> Result<Context, Error> {
 
 /// Returns a Context specific to the Harbor teams deployment environment.
 pub fn harbor_context() -> Result<Context, Error> {
-    let raw_config = match from_env("DB_CONFIG") {
-        None => {
-            return Err(Error::Config("DocumentDB config not set".to_string()));
-        }
-        Some(raw_config) => raw_config,
-    };
+    let raw_config = required_env("DB_CONFIG", "DocumentDB config not set")?;
 
     let cfg: DocDbConfig = serde_json::from_str(raw_config.as_str()).map_err(Error::Serde)?;
 
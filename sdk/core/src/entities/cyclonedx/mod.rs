@@ -41,51 +41,38 @@ impl Bom {
 
     /// Extracts the Component for the Bom.
     pub fn component(&self) -> Option<Component> {
-        if let Some(component) = self.metadata.as_deref()?.component.as_deref() {
-            return Some(component.clone());
-        }
+        self.component_ref().cloned()
+    }
 
-        None
+    /// Borrows the metadata Component so accessors can read single fields without cloning
+    /// the whole Component.
+    fn component_ref(&self) -> Option<&Component> {
+        self.metadata.as_deref()?.component.as_deref()
     }
 
     /// Extracts the Component Name for the BOM if available.
     pub fn component_name(&self) -> Option<String> {
-        match self.component() {
-            None => None,
-            Some(component) => Some(component.name),
-        }
+        self.component_ref().map(|component| component.name.clone())
     }
 
     /// Extracts the Component Version for the BOM if available.
     pub fn component_version(&self) -> Option<String> {
-        if let Some(version) = self.component()?.version {
-            return Some(version);
-        }
-
-        None
+        self.component_ref()?.version.clone()
     }
 
     /// Extracts the Supplier Name for the BOM if available.
     pub fn supplier_name(&self) -> Option<String> {
-        if let Some(name) = &self.component()?.supplier.as_deref()?.name {
-            return Some(name.clone());
-        }
-
-        None
+        self.component_ref()?.supplier.as_deref()?.name.clone()
     }
 
     /// Extracts the CPE for the BOM if available.
     pub fn cpe(&self) -> Option<String> {
-        if let Some(cpe) = self.component()?.cpe {
-            return Some(cpe);
-        }
-
-        None
+        self.component_ref()?.cpe.clone()
     }
 
     /// Extracts the Purl for the Bom.
     pub fn purl(&self) -> Option<String> {
-        self.metadata.clone()?.component?.purl
+        self.component_ref()?.purl.clone()
     }
 
     /// Best effort algorithm to build a valid Purl for the Sbom by extracting values from the
@@ -95,8 +82,11 @@ impl Bom {
         default_name: Option<String>,
         default_version: Option<String>,
     ) -> Option<String> {
+        // Resolve the metadata once and borrow it for both the name and version lookups.
+        let metadata = self.metadata.as_deref()?;
+
         // Try to get the name from the Sbom directly.
-        let component_name = match &self.metadata.clone()?.component {
+        let component_name = match metadata.component.as_deref() {
             None => "".to_string(),
             Some(component) => component.name.clone(),
         };
@@ -113,7 +103,7 @@ impl Bom {
         };
 
         // set a default version if unable to resolve.
-        let version = match self.metadata.clone()?.component?.version {
+        let version = match metadata.component.as_deref()?.version.clone() {
             None => match default_version {
                 None => "not-set".to_string(),
                 Some(c) => {
@@ -203,25 +203,13 @@ impl Package {
 
     /// Appends Vulnerabilities to the Purl.
     pub fn vulnerabilities(&mut self, new: &Vulnerability) {
-        if self.vulnerabilities.is_empty() {
-            self.vulnerabilities = vec![new.clone()];
-            return;
-        }
-
-        let mut current = self.vulnerabilities.clone();
-
-        match self
+        if !self
             .vulnerabilities
             .iter()
             .any(|existing| existing.cve == new.cve && existing.provider == new.provider)
         {
-            true => {}
-            false => {
-                current.push(new.clone());
-            }
+            self.vulnerabilities.push(new.clone());
         }
-
-        self.vulnerabilities = current;
     }
 }
 
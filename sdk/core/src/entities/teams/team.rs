@@ -61,17 +61,41 @@ impl Team {
         self
     }
 
-    /// Add a token to the tokens Vector.
-    pub fn tokens(&mut self, _token: Token) -> &Self {
-        // TODO:
+    /// Upsert a token to the tokens map, keyed by token id.
+    pub fn tokens(&mut self, token: Token) -> &Self {
+        self.tokens
+            .get_or_insert_with(HashMap::new)
+            .insert(token.id.clone(), token);
         self
     }
 
+    /// Remove a token from the tokens map by id. Returns the removed [Token], if it existed.
+    pub fn remove_token(&mut self, token_id: &str) -> Option<Token> {
+        self.tokens.as_mut()?.remove(token_id)
+    }
+
     /// Determines if the specified repository is owned by a team instance.
-    pub fn owns_repository(&self, repository_id: String) -> bool {
+    pub fn owns_repository(&self, repository_id: &str) -> bool {
         match &self.repositories {
             None => false,
-            Some(repositories) => repositories.contains_key(repository_id.as_str()),
+            Some(repositories) => repositories.contains_key(repository_id),
         }
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use crate::entities::teams::{assert_token_map, Team};
+
+    #[test]
+    fn can_upsert_and_remove_tokens() {
+        assert_token_map(
+            Team::new("team".to_string(), None).unwrap(),
+            |entity, token| {
+                entity.tokens(token);
+            },
+            Team::remove_token,
+            |entity| entity.tokens.as_ref(),
+        );
+    }
+}
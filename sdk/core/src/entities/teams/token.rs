@@ -114,3 +114,39 @@ impl Token {
         argon2::verify(self.hash.as_str(), input).map_err(Error::from)
     }
 }
+
+/// Asserts the token map behavior shared by entities that own tokens: insert into an empty map,
+/// upsert by id, and removal of existing and missing ids.
+#[cfg(test)]
+pub(crate) fn assert_token_map<E>(
+    mut entity: E,
+    upsert: fn(&mut E, Token),
+    remove: fn(&mut E, &str) -> Option<Token>,
+    tokens: fn(&E) -> Option<&std::collections::HashMap<String, Token>>,
+) {
+    let token = |id: &str, name: &str| Token {
+        id: id.to_string(),
+        name: name.to_string(),
+        hash: "".to_string(),
+        enabled: true,
+        expires: "".to_string(),
+        team_id: None,
+        vendor_id: None,
+    };
+
+    assert!(tokens(&entity).is_none());
+    assert!(remove(&mut entity, "t1").is_none());
+
+    upsert(&mut entity, token("t1", "first"));
+    assert_eq!(1, tokens(&entity).unwrap().len());
+
+    upsert(&mut entity, token("t1", "replaced"));
+    assert_eq!(1, tokens(&entity).unwrap().len());
+    assert_eq!("replaced", tokens(&entity).unwrap()["t1"].name);
+
+    assert!(remove(&mut entity, "t2").is_none());
+    assert_eq!(1, tokens(&entity).unwrap().len());
+
+    assert_eq!("t1", remove(&mut entity, "t1").unwrap().id);
+    assert!(tokens(&entity).unwrap().is_empty());
+}
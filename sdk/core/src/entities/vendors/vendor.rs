@@ -51,40 +51,58 @@ impl Vendor {
             return Err(Error::Entity("invalid product for vendor".to_string()));
         }
 
-        let mut products = match &self.products {
-            None => HashMap::new(),
-            Some(products) => products.clone(),
-        };
-
-        if products.contains_key(product.id.as_str()) {
-            products.insert(product.id.clone(), product);
-            self.products = Some(products);
-            return Ok(self);
-        }
+        // Mutate the existing map in place rather than cloning it on every upsert.
+        let products = self.products.get_or_insert_with(HashMap::new);
 
-        for (_, existing) in products.iter() {
-            if existing.name == product.name && existing.version == product.version {
-                return Err(Error::Entity("product exists for version".to_string()));
+        if !products.contains_key(product.id.as_str()) {
+            for existing in products.values() {
+                if existing.name == product.name && existing.version == product.version {
+                    return Err(Error::Entity("product exists for version".to_string()));
+                }
             }
         }
 
         products.insert(product.id.clone(), product);
-        self.products = Some(products);
 
         Ok(self)
     }
 
     /// Determines if the specified product id is owned by an instance of a Vendor.
-    pub fn owns_product(&self, product_id: String) -> bool {
+    pub fn owns_product(&self, product_id: &str) -> bool {
         match &self.products {
             None => false,
-            Some(products) => products.contains_key(product_id.as_str()),
+            Some(products) => products.contains_key(product_id),
         }
     }
 
-    /// Add a product to the products Vector.
-    pub fn tokens(&mut self, _token: Token) -> &Self {
-        // TODO:
+    /// Upsert a token to the tokens map, keyed by token id.
+    pub fn tokens(&mut self, token: Token) -> &Self {
+        self.tokens
+            .get_or_insert_with(HashMap::new)
+            .insert(token.id.clone(), token);
         self
     }
+
+    /// Remove a token from the tokens map by id. Returns the removed [Token], if it existed.
+    pub fn remove_token(&mut self, token_id: &str) -> Option<Token> {
+        self.tokens.as_mut()?.remove(token_id)
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use crate::entities::teams::assert_token_map;
+    use crate::entities::vendors::Vendor;
+
+    #[test]
+    fn can_upsert_and_remove_tokens() {
+        assert_token_map(
+            Vendor::new("vendor".to_string()).unwrap(),
+            |entity, token| {
+                entity.tokens(token);
+            },
+            Vendor::remove_token,
+            |entity| entity.tokens.as_ref(),
+        );
+    }
 }
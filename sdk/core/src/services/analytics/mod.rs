@@ -5,12 +5,12 @@ use std::collections::HashMap;
 
 use crate::{config, Error};
 use async_trait::async_trait;
-use platform::filesystem::make_file_name_safe;
+use platform::filesystem::{make_file_name_safe, write_json};
 use platform::persistence::s3;
 use platform::persistence::s3::to_safe_object_key;
 use serde_json::Value;
 use std::fmt::Debug;
-use std::io::{BufReader, Cursor};
+use std::io::BufReader;
 
 /// Ensuring the file name is safe
 fn get_file_name(purl: &str) -> Result<String, Error> {
@@ -56,7 +56,6 @@ impl StorageProvider for FileSystemStorageProvider {
         let target_dir = format!("{}/analytic-{}", self.out_dir, provider_name);
         let file_name = get_file_name(purl)?;
         let file_path = format!("{}/{}", target_dir, file_name);
-        let json_raw = serde_json::to_string(&json).map_err(Error::Serde)?;
 
         match std::fs::create_dir_all(target_dir.clone()) {
             Ok(_) => {}
@@ -68,12 +67,8 @@ impl StorageProvider for FileSystemStorageProvider {
             }
         }
 
-        match std::fs::write(file_path.as_str(), json_raw) {
-            Ok(_) => {}
-            Err(e) => {
-                return Err(Error::Runtime(format!("write::{}", e)));
-            }
-        }
+        write_json(file_path.as_str(), &json)
+            .map_err(|e| Error::Runtime(format!("write::{}", e)))?;
 
         Ok(file_name)
     }
@@ -87,7 +82,7 @@ pub struct S3StorageProvider {}
 impl StorageProvider for S3StorageProvider {
     async fn write(&self, purl: &str, json: Value, provider_name: &str) -> Result<String, Error> {
         let metadata = HashMap::<String, String>::new();
-        let s3_store = s3::Store::new_from_env().await?;
+        let s3_store = s3::Store::shared().await?;
         let bucket_name = config::harbor_bucket()?;
 
         let mut object_key = get_s3_key_name(purl)?;
@@ -95,9 +90,7 @@ impl StorageProvider for S3StorageProvider {
 
         let json_raw = serde_json::to_vec(&json).map_err(Error::Serde)?;
 
-        let json_string = json.to_string();
-        let cursor = Cursor::new(json_string.into_bytes());
-        let reader = BufReader::new(cursor);
+        let reader = BufReader::new(json_raw.as_slice());
         let checksum = platform::cryptography::sha256::reader_checksum_sha256(reader)?;
         let checksum = platform::encoding::base64::standard_encode(checksum.as_str());
 
@@ -12,6 +12,8 @@ use platform::hyper::Client as HttpClient;
 use crate::services::github::error::Error;
 
 const GH_URL: &str = "https://api.github.com";
+/// Maximum page size supported by the GitHub list repositories endpoint.
+const REPOS_PER_PAGE: u32 = 100;
 
 #[derive(Debug)]
 /// GitHub Client for hitting the HTTP API
@@ -155,15 +157,7 @@ impl Client {
 
         println!("==> Number of Repositories in {}: {}", org, num_repos);
 
-        let num_calls = ((num_repos / 100) as i8) + 1;
-        let num_last_call = num_repos % 100;
-
-        let mut vector = vec![100; usize::try_from(num_calls).unwrap()];
-
-        // This is crazy that it works.
-        *vector.last_mut().unwrap() = num_last_call;
-
-        Ok(vector)
+        Ok(page_sizes(num_repos))
     }
 
     /// Function to get the data for a page of repos
@@ -327,6 +321,16 @@ fn default_bool() -> bool {
     false
 }
 
+/// Returns the per_page value for each page needed to list num_repos repositories.
+/// GitHub computes page offsets from per_page, so every page must request the same size.
+/// The final page simply returns fewer results. Shrinking its per_page would shift the
+/// offset and re-fetch earlier repos. An exact multiple of the page size also must not
+/// produce a trailing empty page.
+fn page_sizes(num_repos: u32) -> Vec<u32> {
+    let num_calls = num_repos.div_ceil(REPOS_PER_PAGE) as usize;
+    vec![REPOS_PER_PAGE; num_calls]
+}
+
 /// Little function to define default Strings
 /// for struct values that are to be used to collect Json
 pub fn empty_string() -> String {
@@ -346,10 +350,22 @@ pub fn default_version() -> String {
 
 #[cfg(test)]
 mod test {
-    use crate::services::github::client::{Client, Repo};
+    use crate::services::github::client::{page_sizes, Client, Repo, REPOS_PER_PAGE};
     use crate::services::github::error::Error;
     use platform::config::from_env;
 
+    #[test]
+    fn page_sizes_cover_all_repos() {
+        assert!(page_sizes(0).is_empty());
+        assert_eq!(page_sizes(1), vec![REPOS_PER_PAGE]);
+        assert_eq!(page_sizes(100), vec![REPOS_PER_PAGE]);
+        assert_eq!(page_sizes(101), vec![REPOS_PER_PAGE; 2]);
+
+        let pages = page_sizes(12_800);
+        assert_eq!(pages.len(), 128);
+        assert!(pages.iter().all(|per_page| *per_page == REPOS_PER_PAGE));
+    }
+
     /// Requires GITHUB_PAT environment variable
     #[tokio::test]
     #[ignore = "debug manual only"]
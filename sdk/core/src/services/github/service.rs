@@ -7,6 +7,7 @@ use platform::persistence::mongodb::Service as MongoService;
 use platform::persistence::mongodb::Store;
 use platform::str::get_random_string;
 use platform::Error as PlatformError;
+use std::collections::HashMap;
 use std::sync::Arc;
 
 /// Definition of the GitHubProvider
@@ -48,10 +49,15 @@ impl GitHubService {
             println!("==> processing page {}. There are {} repos", page, per_page);
 
             for repo in gh_org_rsp.iter_mut() {
-                let version = self.client.get_latest_release_tag(repo).await?;
-                repo.add_version(version);
+                // The release tag and last commit lookups are independent, so issue them
+                // concurrently rather than paying for two sequential round trips per repo.
+                let (version, last_hash_result) = tokio::join!(
+                    self.client.get_latest_release_tag(repo),
+                    self.client.get_last_commit(repo)
+                );
+
+                repo.add_version(version?);
 
-                let last_hash_result = self.client.get_last_commit(repo).await;
                 match last_hash_result {
                     Ok(last_hash) => repo.add_last_hash(last_hash),
                     Err(err) => {
@@ -73,15 +79,16 @@ impl GitHubService {
         Ok(repo_vec)
     }
 
-    /// Find files of a certain name in a git repo using the git2 crate
+    /// Find files with any of the specified names in a git repo using a single walk of the tree.
+    /// Results are keyed by file name.
     pub fn find_build_targets(
         &self,
         url: String,
-        file_name: String,
-        clone_path: String,
-    ) -> Result<Vec<String>, Error> {
+        file_names: &[&str],
+        clone_path: &str,
+    ) -> Result<HashMap<String, Vec<String>>, Error> {
         Git::new(url)
-            .find(file_name, clone_path)
+            .find_all(file_names, clone_path)
             .map_err(|_err| Error::Find())
     }
 
@@ -107,8 +107,17 @@ impl Service<Product> for ProductService {
             Some(vendors) => vendors.clone(),
         };
 
+        // The vendor lookup and duplicate check are independent, so run them concurrently.
+        let (vendor, is_duplicate) = tokio::join!(
+            vendors.find(product.vendor_id.as_str()),
+            self.is_duplicate(HashMap::from([
+                ("name", product.name.as_str()),
+                ("version", product.version.as_str()),
+            ]))
+        );
+
         // Validate vendor exists.
-        let mut vendor = match vendors.find(product.vendor_id.as_str()).await {
+        let mut vendor = match vendor {
             Ok(vendor) => match vendor {
                 None => {
                     return Err(Error::Entity("invalid vendor id".to_string()));
@@ -123,13 +132,7 @@ impl Service<Product> for ProductService {
         // WATCH: Name and version should be inherently unique, but it seems likely that there
         // would be
         // Validate product does not exist for vendor.
-        match self
-            .is_duplicate(HashMap::from([
-                ("name", product.name.as_str()),
-                ("version", product.version.as_str()),
-            ]))
-            .await
-        {
+        match is_duplicate {
             Ok(is_duplicate) => {
                 if is_duplicate {
                     return Err(Error::Entity("product exists".to_string()));
@@ -65,14 +65,16 @@ impl StorageProvider for FileSystemStorageProvider {
 
         let file_name = format!("{}-{}", purl, sbom.instance);
         let file_path = format!("{}/{}", self.out_dir, file_name);
-        match std::fs::write(file_path.as_str(), raw) {
+        match std::fs::write(file_path.as_str(), &raw) {
             Ok(_) => {}
             Err(e) => {
                 return Err(Error::Runtime(format!("write::{}", e)));
             }
         }
 
-        let checksum = platform::cryptography::sha256::file_checksum_sha256(file_path)?;
+        // Checksum the bytes already in memory rather than reading the file back from disk.
+        let reader = BufReader::new(raw.as_slice());
+        let checksum = platform::cryptography::sha256::reader_checksum_sha256(reader)?;
         let checksum = platform::encoding::base64::standard_encode(checksum.as_str());
         sbom.checksum_sha256 = checksum;
 
@@ -97,7 +99,7 @@ impl StorageProvider for S3StorageProvider {
         let metadata = xref.as_ref().map(xrefs::flatten);
 
         // TODO: Probably want to inject these values.
-        let s3_store = s3::Store::new_from_env().await?;
+        let s3_store = s3::Store::shared().await?;
         let bucket_name = config::harbor_bucket()?;
         let mut object_key = format!("{}-{}", purl, sbom.instance);
         object_key = to_safe_object_key(object_key.as_str())?;
@@ -4,7 +4,6 @@ use std::env;
 #[cfg(test)]
 use std::path::PathBuf;
 use std::process::Command;
-use std::str;
 
 use crate::Error;
 
@@ -87,9 +86,9 @@ pub fn generate(sbom_path: String) -> Result<Report, Error> {
                 .arg("json")
                 .output()
                 .expect("failed to execute process");
-            let raw_report = str::from_utf8(&result.stdout).unwrap().to_string();
-
-            let report: Report = serde_json::from_str(&raw_report).unwrap_or({
+            // Parse stdout bytes directly rather than validating and copying them into a String
+            // first, and only build the empty fallback report when parsing fails.
+            let report: Report = serde_json::from_slice(&result.stdout).unwrap_or_else(|_| {
                 let empty_row = ReportValue {
                     ratio: 0.0,
                     reasoning: String::new(),
@@ -1,7 +1,8 @@
-use std::collections::HashMap;
+use std::collections::{HashMap, HashSet};
 use std::sync::Arc;
 
 use platform::persistence::mongodb::{Service, Store};
+use tracing::{debug, error};
 
 use crate::entities::sboms::{Author, CdxFormat, Sbom, SbomProviderKind};
 use crate::entities::tasks::Task;
@@ -81,7 +82,7 @@ impl SbomService {
             Ok(sbom) => sbom,
             Err(e) => {
                 let msg = format!("ingest::from_raw_cdx::{}", e);
-                println!("{}", msg);
+                error!("{}", msg);
                 return Err(Error::Sbom(msg));
             }
         };
@@ -91,7 +92,7 @@ impl SbomService {
             Ok(_) => {}
             Err(e) => {
                 let msg = format!("ingest::set_instance_by_purl::{}", e);
-                println!("{}", msg);
+                error!("{}", msg);
                 return Err(Error::Sbom(msg));
             }
         }
@@ -103,12 +104,12 @@ impl SbomService {
         {
             Ok(()) => {
                 // TODO: Emit Metric.
-                println!("ingest::write_to_storage::success");
+                debug!("ingest::write_to_storage::success");
             }
             Err(e) => {
                 // TODO: Emit Metric.
                 let msg = format!("ingest::write_to_storage::{}", e);
-                println!("{}", msg);
+                error!("{}", msg);
                 return Err(Error::Sbom(msg));
             }
         };
@@ -172,8 +173,17 @@ impl SbomService {
             return Err(Error::Sbom(errs));
         }
 
-        // Upsert packages for each dependency.
+        // Upsert packages for each dependency. SBOMs frequently list the same component more
+        // than once, so only upsert the first occurrence of each purl. Repeats would cost a
+        // query and a write each while producing the same document.
+        let mut upserted = HashSet::new();
         for dependency in package.dependencies.iter_mut() {
+            if let Some(purl) = &dependency.purl {
+                if !upserted.insert(purl.clone()) {
+                    continue;
+                }
+            }
+
             match packages
                 .upsert_package_by_purl(dependency, Some(&xref))
                 .await
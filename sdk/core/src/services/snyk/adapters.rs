@@ -89,7 +89,7 @@ impl Project {
         let mut status = ProjectStatus::default();
         let mut package_manager = "unknown".to_string();
 
-        match inner.clone().attributes {
+        match &inner.attributes {
             None => {}
             Some(attrs) => {
                 project_name = attrs.name.clone();
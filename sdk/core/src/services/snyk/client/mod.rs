@@ -50,6 +50,7 @@ fn sbom_url(org_id: &str, project_id: &str, format: SbomFormat) -> String {
 /// A purpose build Snyk HTTP Client.
 #[derive(Debug)]
 pub struct Client {
+    /// The Authorization header value, formatted once at construction.
     token: String,
     inner: hyper::Client,
 }
@@ -58,20 +59,17 @@ impl Client {
     /// Factory method for creating new instances of a Client.
     pub fn new(token: String) -> Self {
         let inner = hyper::Client::new();
+        let token = format!("token {}", token);
         Self { token, inner }
     }
 
-    fn token(&self) -> String {
-        format!("token {}", self.token)
-    }
-
     pub async fn orgs(&self) -> Result<Option<Vec<OrgV1>>, Error> {
         let response: Option<OrgsResponse> = self
             .inner
             .get(
                 &orgs_url(),
                 ContentType::Json,
-                &self.token(),
+                &self.token,
                 None::<OrgsResponse>,
             )
             .await?;
@@ -91,7 +89,7 @@ impl Client {
             .get(
                 &projects_url(org_id),
                 ContentType::Json,
-                &self.token(),
+                &self.token,
                 None::<ListOrgProjects200Response>,
             )
             .await?;
@@ -108,15 +106,15 @@ impl Client {
         project_id: &str,
         format: SbomFormat,
     ) -> Result<Option<String>, Error> {
-        let url = &sbom_url(org_id, project_id, format.clone());
+        let url = &sbom_url(org_id, project_id, format);
         debug!(url);
         let response = self
             .inner
             .raw(
                 hyper::Method::GET,
-                &sbom_url(org_id, project_id, format),
+                url,
                 ContentType::Json,
-                self.token(),
+                &self.token,
                 None::<String>,
             )
             .await?;
@@ -147,7 +145,7 @@ impl Client {
             .get(
                 &issues_url(org_id, purl),
                 ContentType::Json,
-                &self.token(),
+                &self.token,
                 None::<IssuesResponse>,
             )
             .await?;
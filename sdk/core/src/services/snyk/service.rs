@@ -107,15 +107,18 @@ impl SnykService {
                     )));
                 }
 
+                // Resolve the group once per org and move each native project into its adapter
+                // rather than cloning it.
+                let group = org.group();
                 let mut results = vec![];
 
-                projects.iter().for_each(|inner| {
+                projects.into_iter().for_each(|inner| {
                     results.push(Project::new(
-                        org.group().id,
-                        org.group().name,
+                        group.id.clone(),
+                        group.name.clone(),
                         org.id.clone(),
                         org.name.clone(),
-                        inner.clone(),
+                        inner,
                     ));
                 });
 
@@ -248,8 +248,10 @@ impl Service {
             return Err(Error::Syft("syft generated empty SBOM".to_string()));
         };
 
-        let output: String = String::from_utf8_lossy(&output.stdout).to_string();
-        let mut sbom: Bom = Bom::parse(output.as_str(), CdxFormat::Json).map_err(Error::Core)?;
+        // Lossy conversion only allocates if stdout contains invalid UTF-8, so parse the
+        // borrowed output rather than copying it into an owned String first.
+        let output = String::from_utf8_lossy(&output.stdout);
+        let mut sbom: Bom = Bom::parse(output.as_ref(), CdxFormat::Json).map_err(Error::Core)?;
 
         let metadata =
             ensure_purl_in_metadata(sbom.clone(), full_name, version, cataloger, sub_path);
@@ -265,9 +267,7 @@ impl Service {
             env::set_current_dir(path).map_err(Error::Io)?
         }
 
-        let sbom_value = serde_json::to_value(sbom).map_err(Error::Serde)?;
-        let string_value = serde_json::to_string(&sbom_value).map_err(Error::Serde)?;
-        Ok(string_value)
+        serde_json::to_string(&sbom).map_err(Error::Serde)
     }
 }
 
@@ -4,7 +4,7 @@ pub use service::*;
 use std::collections::HashMap;
 
 use async_trait::async_trait;
-use platform::filesystem::make_file_name_safe;
+use platform::filesystem::{make_file_name_safe, write_json};
 use platform::persistence::s3;
 use platform::persistence::s3::to_safe_object_key;
 use std::fmt::Debug;
@@ -73,14 +73,8 @@ impl StorageProvider for FileSystemStorageProvider {
         let file_name = format!("{}-{}.json", provider, make_file_name_safe(purl)?);
         let file_path = format!("{}/{}", self.out_dir, file_name);
 
-        let json_raw = serde_json::to_string(vulnerabilities).map_err(Error::Serde)?;
-
-        match std::fs::write(file_path.as_str(), json_raw) {
-            Ok(_) => {}
-            Err(e) => {
-                return Err(Error::Runtime(format!("write::{}", e)));
-            }
-        }
+        write_json(file_path.as_str(), vulnerabilities)
+            .map_err(|e| Error::Runtime(format!("write::{}", e)))?;
 
         // TODO: Add checksum to vulnerabilities files and relate Sboms to Findings.
         // let checksum = platform::cryptography::sha256::file_checksum(file_path)?;
@@ -116,7 +110,7 @@ impl StorageProvider for S3StorageProvider {
         }
 
         // TODO: Probably want to inject these values.
-        let s3_store = s3::Store::new_from_env().await?;
+        let s3_store = s3::Store::shared().await?;
         let bucket_name = config::harbor_bucket()?;
 
         let object_key = format!("vulnerabilities-{}-{}", provider, to_safe_object_key(purl)?);
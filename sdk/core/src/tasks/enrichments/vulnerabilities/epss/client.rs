@@ -1,6 +1,11 @@
 use crate::Error;
 use platform::hyper::ContentType;
 use serde::{Deserialize, Serialize};
+use std::collections::HashMap;
+
+/// Maximum number of CVEs submitted in a single request. Matches the default page size of the
+/// EPSS API, so a full batch is always returned in one response.
+pub(in crate::tasks::enrichments::vulnerabilities::epss) const BATCH_SIZE: usize = 100;
 
 #[derive(Debug)]
 pub(in crate::tasks::enrichments::vulnerabilities::epss) struct Client {
@@ -14,8 +19,10 @@ impl Client {
         Client { inner }
     }
 
-    pub async fn score(&self, cve: String) -> Result<f32, Error> {
-        let uri = format!("https://api.first.org/data/v1/epss?cve={}", cve);
+    /// Retrieves the EPSS scores for a single batch of at most [BATCH_SIZE] CVEs in one request.
+    /// CVEs without a score, or whose score cannot be parsed, are absent from the result.
+    pub async fn scores(&self, cves: &[String]) -> Result<HashMap<String, f32>, Error> {
+        let uri = format!("https://api.first.org/data/v1/epss?cve={}", cves.join(","));
 
         let response: Option<EpssResponse> = self
             .inner
@@ -36,16 +43,20 @@ impl Client {
             )));
         }
 
-        let score = match response.data.iter().find(|score| score.cve == cve) {
-            None => {
-                return Err(Error::Vulnerability("epss_score_not_found".to_string()));
+        let mut scores = HashMap::with_capacity(response.data.len());
+        for score in response.data {
+            match score.epss.parse::<f32>() {
+                Ok(epss) => {
+                    scores.insert(score.cve, epss);
+                }
+                Err(e) => {
+                    // Don't fail the batch on a single bad score.
+                    println!("==> invalid epss score for {}: {}", score.cve, e);
+                }
             }
-            Some(score) => &score.epss,
-        };
+        }
 
-        score
-            .parse::<f32>()
-            .map_err(|e| Error::InvalidFormat(format!("epss_score::{}", e)))
+        Ok(scores)
     }
 }
 
@@ -70,15 +81,15 @@ mod tests {
     use crate::Error;
 
     #[async_std::test]
-    async fn can_get_epss_score() -> Result<(), Error> {
+    async fn can_get_epss_scores() -> Result<(), Error> {
         let client = Client::new();
 
-        let score = client
-            .score("CVE-2021-40438".to_string())
+        let scores = client
+            .scores(&["CVE-2021-40438".to_string(), "CVE-2021-44228".to_string()])
             .await
             .map_err(|e| Error::Vulnerability(e.to_string()))?;
 
-        assert_ne!(0.0_f32, score);
+        assert_eq!(2, scores.len());
 
         Ok(())
     }
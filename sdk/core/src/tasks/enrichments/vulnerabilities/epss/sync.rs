@@ -1,4 +1,4 @@
-use super::client::Client;
+use super::client::{Client, BATCH_SIZE};
 use crate::entities::enrichments::Vulnerability;
 use crate::entities::tasks::Task;
 use crate::tasks::TaskProvider;
@@ -35,6 +35,31 @@ impl TaskProvider for SyncTask {
         println!("==> processing {} vulnerabilities...", total);
         task.count = targets.len() as u64;
 
+        // The same CVE is commonly reported against many packages, so deduplicate before
+        // batching. Scores are requested in chunks of BATCH_SIZE, so the number of requests is
+        // bounded by the number of distinct CVEs rather than by vulnerabilities.
+        let mut cves: Vec<String> = targets.iter().filter_map(|v| v.cve.clone()).collect();
+        cves.sort_unstable();
+        cves.dedup();
+
+        println!("==> fetching scores for {} cves", cves.len());
+        let mut scores = HashMap::with_capacity(cves.len());
+        let mut batch_errors = HashMap::new();
+
+        for batch in cves.chunks(BATCH_SIZE) {
+            match self.client.scores(batch).await {
+                Ok(batch_scores) => scores.extend(batch_scores),
+                Err(e) => {
+                    // Don't fail on a single batch, record the error for each of its CVEs.
+                    println!("==> epss batch failed with error: {}", e);
+                    let e = e.to_string();
+                    for cve in batch {
+                        batch_errors.insert(cve.clone(), e.clone());
+                    }
+                }
+            }
+        }
+
         let mut iteration = 0;
         let mut errors = HashMap::new();
 
@@ -42,7 +67,17 @@ impl TaskProvider for SyncTask {
             iteration += 1;
             println!("==> processing iteration {} of {}", iteration, total);
 
-            match self.process_target(vulnerability).await {
+            if let Some(e) = vulnerability
+                .cve
+                .as_ref()
+                .and_then(|cve| batch_errors.get(cve))
+            {
+                println!("==> iteration {} failed with error: {}", iteration, e);
+                errors.insert(vulnerability.purl.clone(), e.clone());
+                continue;
+            }
+
+            match self.process_target(vulnerability, &scores).await {
                 Ok(_) => {
                     println!("==> iteration {} succeeded", iteration);
                 }
@@ -81,6 +116,7 @@ impl SyncTask {
     pub(in crate::tasks::enrichments::vulnerabilities::epss) async fn process_target(
         &self,
         vulnerability: &mut Vulnerability,
+        scores: &HashMap<String, f32>,
     ) -> Result<(), Error> {
         let cve = match &vulnerability.cve {
             None => {
@@ -89,11 +125,11 @@ impl SyncTask {
             Some(cve) => cve,
         };
 
-        vulnerability.epss_score = match self.client.score(cve.clone()).await {
-            Ok(score) => Some(score),
-            Err(e) => {
-                return Err(Error::Vulnerability(e.to_string()));
+        vulnerability.epss_score = match scores.get(cve) {
+            None => {
+                return Err(Error::Vulnerability("epss_score_not_found".to_string()));
             }
+            Some(score) => Some(*score),
         };
 
         self.update(vulnerability)
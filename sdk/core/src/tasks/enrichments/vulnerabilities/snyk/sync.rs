@@ -142,26 +142,40 @@ impl SyncTask {
             }
         };
 
+        // The storage write only reads the current package snapshot, so run it concurrently
+        // with the upserts instead of making every upsert wait on the upload.
+        let upserts = async {
+            let mut task_refs = Vec::with_capacity(new_vulnerabilities.len());
+
+            for vulnerability in new_vulnerabilities.iter_mut() {
+                let task_ref = match vulnerability.join_task(task) {
+                    Ok(task_ref) => task_ref,
+                    Err(e) => {
+                        let msg = format!("purl::task_refs::{}", e);
+                        return Err(Error::Vulnerability(msg));
+                    }
+                };
+
+                self.vulnerabilities.upsert_by_purl(vulnerability).await?;
+                task_refs.push(task_ref);
+            }
+
+            Ok::<_, Error>(task_refs)
+        };
+
+        let (stored, task_refs) =
+            tokio::join!(self.vulnerabilities.store_by_purl(package), upserts);
+
         // TODO: Store file_path somewhere?
-        let _file_path = match self.vulnerabilities.store_by_purl(package).await {
+        let _file_path = match stored {
             Ok(file_path) => file_path,
             Err(e) => {
                 return Err(Error::Vulnerability(e.to_string()));
             }
         };
 
-        for vulnerability in new_vulnerabilities.iter_mut() {
-            let task_ref = match vulnerability.join_task(task) {
-                Ok(task_ref) => task_ref,
-                Err(e) => {
-                    let msg = format!("purl::task_refs::{}", e);
-                    return Err(Error::Vulnerability(msg));
-                }
-            };
-
-            self.vulnerabilities.upsert_by_purl(vulnerability).await?;
-
-            package.task_refs(&task_ref);
+        for (vulnerability, task_ref) in new_vulnerabilities.iter().zip(task_refs?.iter()) {
+            package.task_refs(task_ref);
             package.vulnerabilities(vulnerability)
         }
 
@@ -181,21 +195,23 @@ impl SyncTask {
             Some(purl) => purl.clone(),
         };
 
+        // Build the discriminator once rather than allocating it for every xref compared.
+        let snyk_kind = XrefKind::External(SNYK_DISCRIMINATOR.to_string());
+
         // TODO: Validate getting this for a single org is good enough. We seem to get dupes.
-        let xref = package.xrefs.iter().find(|x| {
-            x.kind == XrefKind::External(SNYK_DISCRIMINATOR.to_string())
-                && x.map.get("orgId").is_some()
-        });
+        let org_id = package
+            .xrefs
+            .iter()
+            .filter(|x| x.kind == snyk_kind)
+            .find_map(|x| x.map.get("orgId"));
 
-        let xref = match xref {
+        let org_id = match org_id {
             None => {
                 return Err(Error::Snyk("snyk_ref_none".to_string()));
             }
-            Some(xref) => xref,
+            Some(org_id) => org_id,
         };
 
-        let org_id = xref.map.get("orgId").unwrap();
-
         let vulnerabilities = match self
             .snyk
             .vulnerabilities(org_id.as_str(), purl.as_str())
@@ -14,25 +14,8 @@ use crate::tasks::TaskProvider;
 use async_trait::async_trait;
 use platform::persistence::mongodb::{Service, Store};
 use std::collections::HashMap;
-use std::hash::Hash;
 use std::sync::Arc;
 
-/// Nifty function to merge HashMaps.
-fn merge<K: Hash + Eq + Clone, V: Clone>(
-    first_context: &HashMap<K, V>,
-    second_context: &HashMap<K, V>,
-) -> HashMap<K, V> {
-    let mut new_context = HashMap::new();
-    for (key, value) in first_context.iter() {
-        new_context.insert(key.clone(), value.clone());
-    }
-
-    for (key, value) in second_context.iter() {
-        new_context.insert(key.clone(), value.clone());
-    }
-    new_context
-}
-
 /// This function make sure that if there are certain directories in
 /// the build target path, we should skip processing it as it is a dependency
 /// rather than a primary target.  The immediate first example is node_modules.
@@ -84,7 +67,7 @@ impl TaskProvider for SyncTask {
                             for sbom in raw_sboms {
                                 let ingest_errors =
                                     self.ingest_sbom(sbom, url.clone(), task).await?;
-                                errors = merge(&errors, &ingest_errors);
+                                errors.extend(ingest_errors);
                             }
                         }
                         None => println!("==> No work to do because the hashes matched"),
@@ -94,7 +77,7 @@ impl TaskProvider for SyncTask {
             }
         }
 
-        Ok(errors.clone())
+        Ok(errors)
     }
 }
 
@@ -245,6 +228,16 @@ impl SyncTask {
                 let mut syft_results: Vec<String> = vec![];
                 let mut total_build_targets = 0;
 
+                // Walk the cloned tree once for every build target name, rather than once per
+                // name, and look up each name's locations from the result.
+                let build_target_names: Vec<&str> =
+                    BUILD_TARGETS.values().flatten().copied().collect();
+                let mut found_build_targets = self.github.find_build_targets(
+                    url.to_string(),
+                    &build_target_names,
+                    clone_path.as_str(),
+                );
+
                 for (cataloger, build_targets) in BUILD_TARGETS.iter() {
                     for build_target in build_targets {
                         println!(
@@ -252,15 +245,8 @@ impl SyncTask {
                             build_target, cataloger
                         );
 
-                        // TODO refactor find_build_targets() to take a &str
-                        let build_target_locations_result = self.github.find_build_targets(
-                            url.to_string(),
-                            String::from(*build_target),
-                            clone_path.clone(),
-                        );
-
-                        let build_target_locations = match build_target_locations_result {
-                            Ok(build_target_locations) => build_target_locations,
+                        let build_target_locations = match &mut found_build_targets {
+                            Ok(found) => found.remove(*build_target).unwrap_or_default(),
                             Err(err) => {
                                 task.count += 1;
                                 task.ref_errs(build_target.to_string(), err.to_string());
@@ -278,11 +264,13 @@ impl SyncTask {
                         if !build_target_locations.is_empty() {
                             total_build_targets += build_target_locations.len();
 
+                            // Slice off the name of the file and the leading '/' as execute()
+                            // function only takes a path. The suffix is the same for every
+                            // location, so build it once.
+                            let search_string = format!("/{}", build_target);
+
                             for build_target_location in build_target_locations {
                                 if !location_under_ignored_dir(build_target_location.clone()) {
-                                    // Slice off the name of the file and the leading '/' as
-                                    // execute() function only takes a path
-                                    let search_string = format!("/{}", build_target);
                                     let trimmed_build_target_location =
                                         build_target_location.replace(search_string.as_str(), "");
 
@@ -1,6 +1,14 @@
 use crate::Error;
 use platform::testing::fixture_path;
 
+lazy_static! {
+    /// The SBOM test fixture, read from disk on first use and shared by all subsequent callers.
+    static ref SBOM_RAW: Result<String, String> = match fixture_path("sbom-fixture.json") {
+        Ok(path) => std::fs::read_to_string(path).map_err(|e| e.to_string()),
+        Err(e) => Err(e.to_string()),
+    };
+}
+
 /// Returns the path to the SBOM test fixture.
 pub fn sbom_fixture_path() -> Result<String, Error> {
     fixture_path("sbom-fixture.json").map_err(|e| Error::Config(e.to_string()))
@@ -8,6 +16,5 @@ pub fn sbom_fixture_path() -> Result<String, Error> {
 
 /// Returns the SBOM test fixture as a String in memory.
 pub fn sbom_raw() -> Result<String, Error> {
-    let sbom_path = sbom_fixture_path()?;
-    std::fs::read_to_string(sbom_path).map_err(|e| Error::Config(e.to_string()))
+    SBOM_RAW.clone().map_err(Error::Config)
 }
@@ -1,5 +1,5 @@
 use harbcore::config::dev_context;
-use harbcore::testing::sbom_fixture_path;
+use harbcore::testing::sbom_raw;
 use harbcore::Error;
 use platform::persistence::mongodb::{MongoDocument, Store};
 use std::collections::HashMap;
@@ -10,6 +10,8 @@ use uuid::Uuid;
 /// Scenario builder used to setup and teardown test scenarios.
 pub struct Scenario {
     pub(crate) store: Arc<Store>,
+    /// Runtime shared by the blocking helpers so each call does not build its own.
+    rt: runtime::Runtime,
 }
 
 impl Scenario {
@@ -23,7 +25,9 @@ impl Scenario {
             Some(s) => s,
         };
 
-        Ok(Self { store })
+        let rt = runtime::Runtime::new().map_err(|e| Error::Runtime(e.to_string()))?;
+
+        Ok(Self { store, rt })
     }
 
     /// Store an arbitrary entity to the datastore.
@@ -31,10 +35,9 @@ impl Scenario {
     where
         E: MongoDocument,
     {
-        let rt = runtime::Runtime::new().map_err(|e| Error::Runtime(e.to_string()))?;
         entity.set_id(Uuid::new_v4().to_string());
 
-        rt.block_on(async {
+        self.rt.block_on(async {
             match self
                 .store
                 .insert::<E>(entity)
@@ -52,9 +55,7 @@ impl Scenario {
     where
         E: MongoDocument,
     {
-        let rt = runtime::Runtime::new().map_err(|e| Error::Runtime(e.to_string()))?;
-
-        rt.block_on(async {
+        self.rt.block_on(async {
             match self
                 .store
                 .update::<E>(entity)
@@ -101,7 +102,8 @@ impl Scenario {
 /// Load the default SBOM test fixture to a string for processing in test cases.
 #[allow(dead_code)]
 pub fn raw_sbom() -> Result<String, Error> {
-    std::fs::read_to_string(sbom_fixture_path()?).map_err(|e| Error::Entity(e.to_string()))
+    // Served from the fixture cache so the file is only read once per test binary.
+    sbom_raw()
 }
 
 #[cfg(test)]
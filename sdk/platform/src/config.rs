@@ -10,13 +10,11 @@ pub fn type_from_env<T>(key: &str) -> Result<T, Error>
 where
     for<'a> T: Default + Deserialize<'a>,
 {
-    let raw = std::env::vars().find(|(k, _)| k == key);
-
-    match raw {
+    match from_env(key) {
         None => Ok(T::default()),
         Some(v) => {
             let result =
-                serde_json::from_str(v.1.as_str()).map_err(|e| Error::Config(e.to_string()))?;
+                serde_json::from_str(v.as_str()).map_err(|e| Error::Config(e.to_string()))?;
 
             Ok(result)
         }
@@ -24,8 +22,11 @@ where
 }
 
 /// Retrieve an environment variable as a String.
+///
+/// Looks the key up directly rather than scanning [std::env::vars], which copies every variable
+/// in the environment on each call.
 pub fn from_env(key: &str) -> Option<String> {
-    std::env::vars().find(|(k, _)| k == key).map(|(_, v)| v)
+    std::env::var(key).ok()
 }
 
 /// Retrieves the AWS SDK config using the default [RegionProviderChain].
@@ -1,6 +1,14 @@
 use crate::str::get_random_string;
 use crate::Error;
 use regex::Regex;
+use serde::Serialize;
+use std::fs::File;
+use std::io::{BufWriter, Write};
+
+lazy_static! {
+    /// Matches any character that is not ASCII alphanumeric. Compiled once on first use.
+    pub(crate) static ref UNSAFE_CHARS: Regex = Regex::new(r"[^A-Za-z0-9]").unwrap();
+}
 
 /// Generates a valid location for operations on data
 pub fn get_tmp_location() -> String {
@@ -20,8 +28,7 @@ pub fn remove_directory(directory: String) -> Result<(), Error> {
 
 /// Function to make the file name safe
 pub fn make_file_name_safe(purl: &str) -> Result<String, Error> {
-    let re = Regex::new(r"[^A-Za-z0-9]").unwrap();
-    let result = re.replace_all(purl, "-");
+    let result = UNSAFE_CHARS.replace_all(purl, "-");
     let mut result = result.as_ref();
     result = result.trim_end_matches('-');
 
@@ -33,3 +40,58 @@ pub fn make_file_name_safe(purl: &str) -> Result<String, Error> {
 
     Ok(result)
 }
+
+/// Serializes a value as JSON straight to a file rather than buffering the whole document in
+/// memory. The document is written to a temporary file alongside the target and renamed into
+/// place on success, so a failed write never leaves a truncated file at the target path.
+pub fn write_json<T: Serialize + ?Sized>(file_path: &str, value: &T) -> Result<(), Error> {
+    let tmp_path = format!("{}.tmp", file_path);
+
+    let result = File::create(tmp_path.as_str())
+        .map_err(|e| Error::Runtime(format!("write_json::create::{}", e)))
+        .and_then(|file| {
+            let mut writer = BufWriter::new(file);
+            serde_json::to_writer(&mut writer, value)?;
+            writer
+                .flush()
+                .map_err(|e| Error::Runtime(format!("write_json::flush::{}", e)))
+        })
+        .and_then(|_| {
+            std::fs::rename(tmp_path.as_str(), file_path)
+                .map_err(|e| Error::Runtime(format!("write_json::rename::{}", e)))
+        });
+
+    if result.is_err() {
+        let _ = std::fs::remove_file(tmp_path.as_str());
+    }
+
+    result
+}
+
+#[cfg(test)]
+mod tests {
+    use crate::filesystem::{get_tmp_location, remove_directory, write_json};
+    use crate::Error;
+    use std::collections::HashMap;
+    use std::path::Path;
+
+    #[test]
+    fn can_write_json() -> Result<(), Error> {
+        let dir = get_tmp_location();
+        std::fs::create_dir_all(dir.as_str()).map_err(|e| Error::Runtime(e.to_string()))?;
+        let file_path = format!("{}/valid.json", dir);
+
+        write_json(file_path.as_str(), &HashMap::from([("key", "value")]))?;
+        let written = std::fs::read_to_string(file_path.as_str())
+            .map_err(|e| Error::Runtime(e.to_string()))?;
+        assert_eq!(r#"{"key":"value"}"#, written);
+
+        // Maps with non-string keys cannot be serialized to JSON.
+        let invalid_path = format!("{}/invalid.json", dir);
+        assert!(write_json(invalid_path.as_str(), &HashMap::from([((1, 2), 3)])).is_err());
+        assert!(!Path::new(invalid_path.as_str()).exists());
+        assert!(!Path::new(format!("{}.tmp", invalid_path).as_str()).exists());
+
+        remove_directory(dir)
+    }
+}
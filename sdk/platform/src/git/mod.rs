@@ -4,6 +4,7 @@ pub mod error;
 use crate::filesystem::remove_directory;
 use crate::git::error::Error;
 use git2::{Repository, TreeWalkResult};
+use std::collections::HashMap;
 use std::path::Path;
 
 /// Git Service
@@ -66,7 +67,18 @@ impl Service {
 
     /// Find files of a certain name in a git repo using the git2 crate
     pub fn find(&self, file_name: String, clone_path: String) -> Result<Vec<String>, Error> {
-        let path = Path::new(clone_path.as_str());
+        let mut found = self.find_all(&[file_name.as_str()], clone_path.as_str())?;
+        Ok(found.remove(file_name.as_str()).unwrap_or_default())
+    }
+
+    /// Find files matching any of the specified names with a single walk of the repository tree.
+    /// Results are keyed by file name. Names with no matches are absent from the map.
+    pub fn find_all(
+        &self,
+        file_names: &[&str],
+        clone_path: &str,
+    ) -> Result<HashMap<String, Vec<String>>, Error> {
+        let path = Path::new(clone_path);
 
         if !path.is_dir() {
             let err = format!("Repo ({}) has not been cloned", self.repo_url);
@@ -76,16 +88,17 @@ impl Service {
             let repo = Repository::open(path)?;
             let head = repo.head()?.peel_to_tree()?;
 
-            let mut files = Vec::new();
+            let mut files: HashMap<String, Vec<String>> = HashMap::new();
 
             head.walk(git2::TreeWalkMode::PreOrder, |root, entry| {
                 if let Some(name) = entry.name() {
-                    if name == file_name {
-                        if root.ends_with('/') {
-                            files.push(format!("{}{}", root, name));
+                    if file_names.contains(&name) {
+                        let file = if root.ends_with('/') {
+                            format!("{}{}", root, name)
                         } else {
-                            files.push(format!("{}/{}", root, name));
-                        }
+                            format!("{}/{}", root, name)
+                        };
+                        files.entry(name.to_string()).or_default().push(file);
                     }
                 }
 
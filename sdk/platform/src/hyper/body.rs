@@ -14,10 +14,10 @@ where
         .await
         .map_err(|_| Error::Http("error parsing body".to_string()))?;
 
-    let body = body.to_vec();
-
-    let result = match std::str::from_utf8(&body) {
-        Ok(body) => body.to_string(),
+    // Hand the buffer to String directly. Converting Bytes into a Vec reuses the allocation when
+    // the buffer is uniquely owned, and validation happens in place without another copy.
+    let result = match String::from_utf8(Vec::from(body)) {
+        Ok(body) => body,
         Err(e) => {
             return Err(Error::Http(e.to_string()));
         }
@@ -1,18 +1,90 @@
 use crate::hyper::{ContentType, Error, Method, StatusCode, CONTENT_TYPE};
+use hyper::body::Bytes;
 use hyper::client::HttpConnector;
+use hyper::header::{HeaderMap, RETRY_AFTER};
 use hyper::{Body, Client as NativeClient, Request, Uri};
 use hyper_rustls::{HttpsConnector, HttpsConnectorBuilder};
+use rand::Rng;
 use serde::de::DeserializeOwned;
 use serde::Serialize;
+use std::cell::RefCell;
+use std::sync::{Arc, Weak};
+use std::time::Duration;
+use tokio::runtime::Handle;
 
 const USER_AGENT: &str = "User-Agent";
 const HARBOR: &str = "SBOM-Harbor";
 
+/// Maximum number of attempts made for a request that receives a retryable status.
+const MAX_ATTEMPTS: u32 = 5;
+/// Delay before the first retry. Doubles after each subsequent attempt.
+const INITIAL_BACKOFF: Duration = Duration::from_millis(500);
+/// Upper bound for the delay between attempts.
+const MAX_BACKOFF: Duration = Duration::from_secs(10);
+/// Longest server requested `Retry-After` delay that is waited out before retrying.
+const MAX_RETRY_AFTER: Duration = Duration::from_secs(120);
+
+type NativeHttpsClient = NativeClient<HttpsConnector<HttpConnector>, Body>;
+
+thread_local! {
+    /// Native client shared by [Client] instances created on this thread, paired with a handle
+    /// that reports whether the Tokio runtime its connections were spawned on is still running.
+    /// The native client is a cheap handle over a connection pool, so sharing it lets TCP and
+    /// TLS sessions be reused across instances instead of being renegotiated each time a new
+    /// [Client] is constructed.
+    static SHARED: RefCell<Option<(Weak<()>, NativeHttpsClient)>> = RefCell::new(None);
+}
+
+/// Builds a native client with its own connection pool.
+fn native_client() -> NativeHttpsClient {
+    let https = HttpsConnectorBuilder::new()
+        .with_native_roots()
+        .https_only()
+        .enable_http2()
+        .build();
+
+    NativeClient::builder().build(https)
+}
+
+/// Returns a native client whose pool is shared with other [Client] instances on the current
+/// runtime. Pooled connections are bound to the runtime that opened them, so a pool is never
+/// handed out once that runtime has shut down. Outside of a runtime an unshared client is
+/// returned.
+fn shared_client() -> NativeHttpsClient {
+    let handle = match Handle::try_current() {
+        Ok(handle) => handle,
+        Err(_) => return native_client(),
+    };
+
+    SHARED.with(|shared| {
+        let mut shared = shared.borrow_mut();
+
+        if let Some((alive, client)) = shared.as_ref() {
+            if alive.strong_count() > 0 {
+                return client.clone();
+            }
+        }
+
+        // The guard lives in a task that never completes, so it is only dropped when the
+        // runtime shuts down and drops its tasks. That invalidates the pool built below.
+        let guard = Arc::new(());
+        let alive = Arc::downgrade(&guard);
+        handle.spawn(async move {
+            let _guard = guard;
+            std::future::pending::<()>().await
+        });
+
+        let client = native_client();
+        *shared = Some((alive, client.clone()));
+        client
+    })
+}
+
 /// Wrapper type over a native Hyper Client. Allows for consistent, concise instance construction
 /// and a conventional set of abstractions over low level methods.
 #[derive(Debug)]
 pub struct Client {
-    inner: NativeClient<HttpsConnector<HttpConnector>, hyper::Body>,
+    inner: NativeHttpsClient,
 }
 
 impl Default for Client {
@@ -25,15 +97,9 @@ impl Client {
     /// Factory method to create new instances of type.
     #[must_use]
     pub fn new() -> Self {
-        let https = HttpsConnectorBuilder::new()
-            .with_native_roots()
-            .https_only()
-            .enable_http2()
-            .build();
-
-        let inner: NativeClient<_, Body> = NativeClient::builder().build(https);
-
-        Self { inner }
+        Self {
+            inner: shared_client(),
+        }
     }
 
     /// Performs a GET request to the specified URL.
@@ -50,7 +116,7 @@ impl Client {
         token: &str,
         payload: Option<T>,
     ) -> Result<Option<U>, Error> {
-        self.request(Method::GET, url, content_type, String::from(token), payload)
+        self.request(Method::GET, url, content_type, token, payload)
             .await
     }
 
@@ -68,14 +134,8 @@ impl Client {
         token: &str,
         payload: Option<T>,
     ) -> Result<Option<U>, Error> {
-        self.request(
-            Method::POST,
-            url,
-            content_type,
-            String::from(token),
-            payload,
-        )
-        .await
+        self.request(Method::POST, url, content_type, token, payload)
+            .await
     }
 
     /// Performs a DELETE request to the specified URL.
@@ -92,14 +152,8 @@ impl Client {
         token: &str,
         payload: Option<T>,
     ) -> Result<Option<U>, Error> {
-        self.request(
-            Method::DELETE,
-            url,
-            content_type,
-            String::from(token),
-            payload,
-        )
-        .await
+        self.request(Method::DELETE, url, content_type, token, payload)
+            .await
     }
 
     /// Performs an HTTP request with the specified HTTP Method.
@@ -116,7 +170,7 @@ impl Client {
         method: Method,
         url: &str,
         content_type: ContentType,
-        token: String,
+        token: &str,
         payload: Option<T>,
     ) -> Result<Option<U>, Error> {
         let result = self.raw(method, url, content_type, token, payload).await?;
@@ -153,43 +207,75 @@ impl Client {
         method: Method,
         url: &str,
         content_type: ContentType,
-        token: String,
+        token: &str,
         payload: Option<T>,
     ) -> Result<(StatusCode, String), Error> {
         let uri: Uri = Uri::try_from(url)?;
-        let req_body: Body = match payload {
+        // Serialize once so that retries can cheaply rebuild the request body.
+        let req_body: Option<Bytes> = match payload {
             Some(p) => {
                 let body = match content_type {
                     ContentType::FormUrlEncoded => serde_urlencoded::to_string(p)?,
                     ContentType::Json => serde_json::to_string(&p)?,
                 };
-                Body::from(body)
+                Some(Bytes::from(body))
             }
-            None => Body::empty(),
+            None => None,
         };
 
-        let mut req: Request<Body> = Request::builder()
-            .method(method)
-            .uri(uri)
-            .header(CONTENT_TYPE, content_type.to_string())
-            .header(USER_AGENT, HARBOR)
-            .body(req_body)?;
+        let mut attempt = 1;
+        let mut backoff = INITIAL_BACKOFF;
 
-        if !token.is_empty() {
-            req.headers_mut().append("Authorization", token.parse()?);
-        }
+        let resp = loop {
+            let body = match &req_body {
+                Some(b) => Body::from(b.clone()),
+                None => Body::empty(),
+            };
 
-        // TODO get the right status somehow
-        let resp = match self.inner.request(req).await {
-            Ok(r) => r,
-            Err(err) => {
-                return Err(Error::Remote(0, err.to_string()));
+            let mut req: Request<Body> = Request::builder()
+                .method(method.clone())
+                .uri(uri.clone())
+                .header(CONTENT_TYPE, content_type.to_string())
+                .header(USER_AGENT, HARBOR)
+                .body(body)?;
+
+            if !token.is_empty() {
+                req.headers_mut().append("Authorization", token.parse()?);
+            }
+
+            // TODO get the right status somehow
+            let resp = match self.inner.request(req).await {
+                Ok(r) => r,
+                Err(err) => {
+                    return Err(Error::Remote(0, err.to_string()));
+                }
+            };
+
+            if attempt >= MAX_ATTEMPTS || !is_retryable(resp.status()) {
+                break resp;
             }
+
+            // Honor the delay the server asked for, so we do not retry before it is ready. A
+            // delay beyond MAX_RETRY_AFTER is not worth blocking on, so the response is returned
+            // to the caller as is. Otherwise fall back to capped exponential backoff with up to
+            // 10% jitter so that concurrent callers throttled together do not retry in lockstep.
+            let delay = match retry_after(resp.headers()) {
+                Some(delay) if delay > MAX_RETRY_AFTER => break resp,
+                Some(delay) => delay,
+                None => {
+                    let jitter = rand::thread_rng().gen_range(0..=backoff.as_millis() as u64 / 10);
+                    backoff + Duration::from_millis(jitter)
+                }
+            };
+            tokio::time::sleep(delay).await;
+
+            attempt += 1;
+            backoff = std::cmp::min(backoff * 2, MAX_BACKOFF);
         };
 
         let resp_status = resp.status();
         let resp_body = hyper::body::to_bytes(resp.into_body()).await?;
-        let resp_body = match String::from_utf8(resp_body.to_vec()) {
+        let resp_body = match String::from_utf8(Vec::from(resp_body)) {
             Ok(body) => body,
             Err(err) => {
                 return Err(Error::Body(err.to_string()));
@@ -200,10 +286,51 @@ impl Client {
     }
 }
 
+/// Indicates whether a response status represents a transient condition worth retrying.
+fn is_retryable(status: StatusCode) -> bool {
+    matches!(
+        status,
+        StatusCode::TOO_MANY_REQUESTS
+            | StatusCode::BAD_GATEWAY
+            | StatusCode::SERVICE_UNAVAILABLE
+            | StatusCode::GATEWAY_TIMEOUT
+    )
+}
+
+/// Reads a `Retry-After` header expressed in delta-seconds. HTTP-date values are ignored and
+/// callers fall back to their own backoff.
+fn retry_after(headers: &HeaderMap) -> Option<Duration> {
+    let seconds = headers
+        .get(RETRY_AFTER)?
+        .to_str()
+        .ok()?
+        .trim()
+        .parse::<u64>()
+        .ok()?;
+    Some(Duration::from_secs(seconds))
+}
+
 #[cfg(test)]
 mod tests {
-    use crate::hyper::client::Client;
+    use crate::hyper::client::{retry_after, Client};
     use crate::hyper::{ContentType, Error, Method, StatusCode};
+    use hyper::header::{HeaderMap, HeaderValue, RETRY_AFTER};
+    use std::time::Duration;
+
+    #[test]
+    fn can_parse_retry_after() {
+        let mut headers = HeaderMap::new();
+        assert_eq!(retry_after(&headers), None);
+
+        headers.insert(RETRY_AFTER, HeaderValue::from_static("3"));
+        assert_eq!(retry_after(&headers), Some(Duration::from_secs(3)));
+
+        headers.insert(
+            RETRY_AFTER,
+            HeaderValue::from_static("Wed, 21 Oct 2015 07:28:00 GMT"),
+        );
+        assert_eq!(retry_after(&headers), None);
+    }
 
     #[async_std::test]
     async fn can_make_get_request() -> Result<(), Error> {
@@ -214,7 +341,7 @@ mod tests {
                 Method::GET,
                 "https://api.first.org/data/v1/epss?cve=CVE-2022-27225",
                 ContentType::Json,
-                "".to_string(),
+                "",
                 None::<String>,
             )
             .await?;
@@ -224,4 +351,32 @@ mod tests {
 
         Ok(())
     }
+
+    #[test]
+    fn can_make_request_after_runtime_shutdown() -> Result<(), Error> {
+        // Each runtime opens a pooled connection that is dropped with it, so the second runtime
+        // must not be handed the first runtime's connection.
+        for _ in 0..2 {
+            let runtime = tokio::runtime::Builder::new_current_thread()
+                .enable_all()
+                .build()
+                .map_err(|e| Error::Hyper(e.to_string()))?;
+
+            let result: (StatusCode, String) = runtime.block_on(async {
+                Client::new()
+                    .raw(
+                        Method::GET,
+                        "https://api.first.org/data/v1/epss?cve=CVE-2022-27225",
+                        ContentType::Json,
+                        "",
+                        None::<String>,
+                    )
+                    .await
+            })?;
+
+            assert_eq!(result.0, StatusCode::OK);
+        }
+
+        Ok(())
+    }
 }
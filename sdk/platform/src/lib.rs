@@ -9,6 +9,9 @@
 /// Core crate
 extern crate core;
 
+#[macro_use]
+extern crate lazy_static;
+
 /// The `auth` module provides a reusable RBAC model inspired by the AWS IAM model. It was initially
 /// developed to solve multi-tenant database access, but as a general purpose RBAC model, it should be
 /// usable in a variety of scenarios.
@@ -34,7 +34,7 @@ where
     }
 
     /// Insert a document into a [Collection].
-    #[instrument]
+    #[instrument(skip(self, doc))]
     async fn insert<'a>(&self, doc: &mut D) -> Result<(), Error> {
         self.insert_inner(doc).await
     }
@@ -57,15 +57,11 @@ where
     }
 
     /// Update a document within a [Collection].
-    #[instrument]
+    #[instrument(skip(self, doc))]
     async fn update(&self, doc: &D) -> Result<(), Error> {
-        let store = self.store();
-        let existing = store.find::<D>(doc.id().as_str()).await?;
-        if existing.is_none() {
-            return Err(Error::Update("item does not exists".to_string()));
-        }
-
-        store.update::<D>(doc).await
+        // The store reports a missing item from the update result itself, so no prior read is
+        // required to validate existence.
+        self.store().update::<D>(doc).await
     }
 
     // TODO: Constrain to a set of known supported/tested operations.
@@ -97,9 +93,6 @@ where
 
     /// Check to see if document is unique for given attributes within a [Collection].
     async fn is_duplicate(&self, filter: HashMap<&str, &str>) -> Result<bool, Error> {
-        match self.store().query::<D>(filter).await {
-            Ok(results) => Ok(!results.is_empty()),
-            Err(e) => Err(e),
-        }
+        self.store().exists::<D>(filter).await
     }
 }
@@ -1,5 +1,6 @@
 use futures_util::TryStreamExt;
 use mongodb::bson::{doc, Bson, Document, SerializerOptions};
+use mongodb::options::CountOptions;
 use mongodb::{bson, Client, Collection, Database};
 use std::collections::HashMap;
 use std::fmt::Debug;
@@ -120,7 +121,7 @@ impl Store {
     }
 
     /// Insert an item in Mongo.
-    #[instrument]
+    #[instrument(skip(doc))]
     pub async fn insert<D>(&self, doc: &D) -> Result<(), Error>
     where
         D: MongoDocument,
@@ -134,8 +135,8 @@ impl Store {
         }
     }
 
-    /// Update an item in Mongo.
-    #[instrument]
+    /// Update an item in Mongo. Returns an [Error::Update] if no item matches the id.
+    #[instrument(skip(doc))]
     pub async fn update<D>(&self, doc: &D) -> Result<(), Error>
     where
         D: MongoDocument,
@@ -148,7 +149,7 @@ impl Store {
             .map_err(|e| Error::Mongo(format!("error generating document for update: {}", e)))
             .unwrap();
 
-        collection
+        let result = collection
             .update_one(
                 doc! {self.key_name.clone(): id },
                 doc! { "$set": doc },
@@ -156,6 +157,10 @@ impl Store {
             )
             .await?;
 
+        if result.matched_count == 0 {
+            return Err(Error::Update("item does not exists".to_string()));
+        }
+
         Ok(())
     }
 
@@ -251,4 +256,25 @@ impl Store {
 
         Ok(result)
     }
+
+    /// Determine whether any item matches the filter expression. Stops at the first match and
+    /// does not transfer or deserialize the matching documents.
+    #[instrument]
+    pub async fn exists<D>(&self, filter_map: HashMap<&str, &str>) -> Result<bool, Error>
+    where
+        D: MongoDocument,
+    {
+        let collection = self.collection::<D>();
+
+        let mut filter = Document::new();
+
+        for f in filter_map {
+            filter.insert(f.0, f.1);
+        }
+
+        let opts = CountOptions::builder().limit(1).build();
+        let count = collection.count_documents(filter, opts).await?;
+
+        Ok(count > 0)
+    }
 }
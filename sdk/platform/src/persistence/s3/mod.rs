@@ -1,17 +1,39 @@
 use crate::config::sdk_config_from_env;
+use crate::filesystem::UNSAFE_CHARS;
 use crate::Error;
 use aws_sdk_s3::error::PutObjectError;
+use aws_sdk_s3::model::{CompletedMultipartUpload, CompletedPart};
 use aws_sdk_s3::types::{ByteStream, DisplayErrorContext};
 use aws_sdk_s3::Client;
 use aws_types::SdkConfig;
-use regex::Regex;
+use futures::stream::{self, StreamExt, TryStreamExt};
+use hyper::body::Bytes;
 use std::collections::HashMap;
-use tracing::instrument;
+use tokio::sync::OnceCell;
+use tracing::{error, instrument};
+
+/// Objects at or above this size are uploaded in concurrent parts rather than a single PUT.
+const MULTIPART_THRESHOLD: usize = 16 * 1024 * 1024;
+/// Size of each part of a multipart upload. S3 requires at least 5 MiB for all but the last part.
+const MULTIPART_PART_SIZE: usize = 8 * 1024 * 1024;
+/// Maximum number of parts of a single object in flight at once.
+const MULTIPART_CONCURRENCY: usize = 4;
+
+lazy_static! {
+    /// Process wide [Store] initialized from the environment on first use.
+    static ref SHARED: OnceCell<Store> = OnceCell::new();
+}
+
+/// Logs an SDK error with its full context and converts it to an [Error::S3].
+fn s3_error<E: std::error::Error>(e: E) -> Error {
+    let msg = DisplayErrorContext(&e);
+    error!("{}", msg);
+    Error::S3(format!("{:#?}", msg))
+}
 
 /// Sanitize a string so that it can be used as an object key in S3.
 pub fn to_safe_object_key(purl: &str) -> Result<String, Error> {
-    let re = Regex::new(r"[^A-Za-z0-9]").unwrap();
-    let result = re.replace_all(purl, "-");
+    let result = UNSAFE_CHARS.replace_all(purl, "-");
     let mut result = result.as_ref();
     result = result.trim_end_matches('-');
 
@@ -27,7 +49,7 @@ pub fn to_safe_object_key(purl: &str) -> Result<String, Error> {
 /// Provides a coarse-grained abstraction over S3 that conforms to the conventions of this crate.
 #[derive(Debug)]
 pub struct Store {
-    config: SdkConfig,
+    client: Client,
 }
 
 /// Custom S3Error type.
@@ -61,7 +83,9 @@ impl From<PutObjectError> for S3Error {
 impl Store {
     /// Factory method for creating new instance of type.
     pub fn new(config: SdkConfig) -> Self {
-        Self { config }
+        Self {
+            client: Client::new(&config),
+        }
     }
 
     /// Factory method for creating new instance of type. SDK Configuration is retrieved from the
@@ -70,12 +94,25 @@ impl Store {
         let config = sdk_config_from_env()
             .await
             .map_err(|e| Error::Config(e.to_string()))?;
-        Ok(Self { config })
+        Ok(Self::new(config))
+    }
+
+    /// Returns a process wide instance configured from the environment. The SDK configuration and
+    /// client are resolved once, so repeated callers skip credential discovery and client setup.
+    pub async fn shared() -> Result<&'static Self, Error> {
+        SHARED.get_or_try_init(Self::new_from_env).await
+    }
+
+    /// Initializes the [Store::shared] instance ahead of first use, so SDK configuration errors
+    /// surface before a long running task starts. Credentials are still resolved lazily by the
+    /// SDK on the first request.
+    pub async fn prewarm() -> Result<(), Error> {
+        Self::shared().await.map(|_| ())
     }
 
     /// Inserts an object to S3. If checksum is passed, it must be base64 encoded. Returns the
     /// version id of the object.
-    #[instrument]
+    #[instrument(skip(body))]
     pub async fn put(
         &self,
         bucket_name: String,
@@ -84,26 +121,29 @@ impl Store {
         body: Vec<u8>,
         metadata: Option<HashMap<String, String>>,
     ) -> Result<(), Error> {
+        // Consume the incoming map so values are moved rather than copied. Only the keys need
+        // rewriting to be S3 safe.
         let metadata = match metadata {
-            Some(incoming) => {
-                let mut result = HashMap::<String, String>::new();
-
-                for (k, v) in incoming.iter() {
-                    let safe_s3_key_name = to_safe_object_key(k)?;
-
-                    result.insert(safe_s3_key_name, v.to_string());
-                }
-
-                Some(result)
-            }
+            Some(incoming) => Some(
+                incoming
+                    .into_iter()
+                    .map(|(k, v)| Ok((to_safe_object_key(k.as_str())?, v)))
+                    .collect::<Result<HashMap<String, String>, Error>>()?,
+            ),
             None => None,
         };
 
-        let client = Client::new(&self.config);
+        if body.len() >= MULTIPART_THRESHOLD {
+            return self
+                .put_multipart(bucket_name, key, Bytes::from(body), metadata)
+                .await;
+        }
+
         let body = ByteStream::from(body);
 
         // TODO: Come back to checksum handling.
-        match client
+        match self
+            .client
             .put_object()
             .bucket(bucket_name.clone())
             .key(key.clone())
@@ -114,11 +154,7 @@ impl Store {
             .await
         {
             Ok(_result) => Ok(()),
-            Err(e) => {
-                let msg = DisplayErrorContext(&e);
-                println!("{}", msg);
-                Err(Error::S3(format!("{:#?}", msg)))
-            }
+            Err(e) => Err(s3_error(e)),
         }
 
         // match checksum_256 {
@@ -138,13 +174,128 @@ impl Store {
         // Ok(())
     }
 
+    /// Uploads a large object as a set of parts transferred concurrently over separate
+    /// connections, so throughput is not limited by a single stream.
+    async fn put_multipart(
+        &self,
+        bucket_name: String,
+        key: String,
+        body: Bytes,
+        metadata: Option<HashMap<String, String>>,
+    ) -> Result<(), Error> {
+        let upload = self
+            .client
+            .create_multipart_upload()
+            .bucket(bucket_name.clone())
+            .key(key.clone())
+            .set_metadata(metadata)
+            .send()
+            .await
+            .map_err(s3_error)?;
+
+        // Without an id there is no upload that can be referenced, so there is nothing to abort.
+        let upload_id = match upload.upload_id() {
+            None => {
+                error!("multipart upload for {} returned no upload id", key);
+                return Err(Error::S3("multipart_upload_id_none".to_string()));
+            }
+            Some(upload_id) => upload_id.to_string(),
+        };
+
+        match self
+            .upload_parts(bucket_name.as_str(), key.as_str(), upload_id.as_str(), body)
+            .await
+        {
+            Ok(()) => Ok(()),
+            Err(e) => {
+                // Abort on any failure after the upload is created, so that S3 does not retain
+                // the orphaned parts.
+                self.abort_multipart(bucket_name, key, upload_id).await;
+                Err(e)
+            }
+        }
+    }
+
+    /// Transfers the parts of a created multipart upload concurrently and completes the upload.
+    async fn upload_parts(
+        &self,
+        bucket_name: &str,
+        key: &str,
+        upload_id: &str,
+        body: Bytes,
+    ) -> Result<(), Error> {
+        // Slicing Bytes is zero-copy, so each part shares the original buffer.
+        let uploads = (0..body.len())
+            .step_by(MULTIPART_PART_SIZE)
+            .enumerate()
+            .map(|(index, start)| {
+                let end = std::cmp::min(start + MULTIPART_PART_SIZE, body.len());
+                let part_number = index as i32 + 1;
+
+                let request = self
+                    .client
+                    .upload_part()
+                    .bucket(bucket_name)
+                    .key(key)
+                    .upload_id(upload_id)
+                    .part_number(part_number)
+                    .body(ByteStream::from(body.slice(start..end)));
+
+                async move {
+                    let output = request.send().await.map_err(s3_error)?;
+                    Ok::<CompletedPart, Error>(
+                        CompletedPart::builder()
+                            .set_e_tag(output.e_tag().map(String::from))
+                            .part_number(part_number)
+                            .build(),
+                    )
+                }
+            });
+
+        let parts: Vec<CompletedPart> = stream::iter(uploads)
+            .buffered(MULTIPART_CONCURRENCY)
+            .try_collect()
+            .await?;
+
+        self.client
+            .complete_multipart_upload()
+            .bucket(bucket_name)
+            .key(key)
+            .upload_id(upload_id)
+            .multipart_upload(
+                CompletedMultipartUpload::builder()
+                    .set_parts(Some(parts))
+                    .build(),
+            )
+            .send()
+            .await
+            .map_err(s3_error)?;
+
+        Ok(())
+    }
+
+    /// Aborts a multipart upload so that S3 discards any parts already uploaded. Failures are
+    /// logged rather than returned, so the caller can surface the error that caused the abort.
+    async fn abort_multipart(&self, bucket_name: String, key: String, upload_id: String) {
+        if let Err(e) = self
+            .client
+            .abort_multipart_upload()
+            .bucket(bucket_name)
+            .key(key)
+            .upload_id(upload_id)
+            .send()
+            .await
+        {
+            error!("{}", DisplayErrorContext(&e));
+        }
+    }
+
     /// Inserts an object to S3. If checksum is passed, it must be base64 encoded. Returns the
     /// version id of the object.
     #[instrument]
     pub async fn delete(&self, bucket_name: String, key: String) -> Result<(), Error> {
-        let client = Client::new(&self.config);
-
-        match client
+        match self
+            .client
             .delete_object()
             .set_key(Some(key.clone()))
             .set_bucket(Some(bucket_name))
@@ -155,7 +306,7 @@ impl Store {
             Err(e) => {
                 let msg = e.into_service_error();
                 let msg = msg.message().unwrap();
-                println!("{}", msg);
+                error!("{}", msg);
                 Err(Error::S3(msg.to_string()))
             }
         }
@@ -163,9 +314,8 @@ impl Store {
 
     /// Lists objects in a bucket
     pub async fn list(&self, bucket_name: String) -> Result<Vec<String>, Error> {
-        let client = Client::new(&self.config);
-
-        match client
+        match self
+            .client
             .list_objects_v2()
             .set_bucket(Some(bucket_name))
             .send()
@@ -201,8 +351,6 @@ mod tests {
         for test_case in test_cases.iter() {
             let result = to_safe_object_key(test_case.purl.as_str())?;
 
-            println!("{}", result);
-
             assert!(!result.starts_with('-'));
             assert!(!result.ends_with('-'));
             assert!(!result.contains("--"));
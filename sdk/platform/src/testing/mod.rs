@@ -27,20 +27,12 @@ pub fn replace_dir(old_path: &str, new_path: &str) -> Result<String, Error> {
 
 /// Gets the path to the workspace root.
 pub fn workspace_dir() -> Result<String, Error> {
-    let output = std::process::Command::new(env!("CARGO"))
-        .arg("locate-project")
-        .arg("--workspace")
-        .arg("--message-format=plain")
-        .output()
-        .unwrap()
-        .stdout;
-    let cargo_path = Path::new(std::str::from_utf8(&output).unwrap().trim());
-    Ok(cargo_path
-        .parent()
-        .unwrap()
-        .to_path_buf()
-        .display()
-        .to_string())
+    // Resolve from this crate's manifest dir (sdk/platform) at compile time rather than
+    // spawning `cargo locate-project` on every call.
+    match Path::new(env!("CARGO_MANIFEST_DIR")).ancestors().nth(2) {
+        None => Err(Error::Config("workspace_dir_not_found".to_string())),
+        Some(dir) => Ok(dir.display().to_string()),
+    }
 }
 
 /// Gets the path to the well-known test fixture directory.
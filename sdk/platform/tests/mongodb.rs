@@ -1,5 +1,7 @@
-use platform::auth::{Action, Effect};
+use platform::auth::{Action, Effect, Role};
+use platform::persistence::mongodb::Store;
 use platform::Error;
+use uuid::Uuid;
 
 mod common;
 use crate::common::mongodb::{local_context, AuthScenario};
@@ -22,6 +24,24 @@ async fn can_crud() -> Result<(), Error> {
     Ok(())
 }
 
+// Tests that updating an item that does not exist is reported rather than silently ignored.
+#[async_std::test]
+async fn can_assert_update_missing_item_fails() -> Result<(), Error> {
+    let ctx = local_context().await?;
+    let store = Store::new(&ctx).await?;
+
+    let role = Role {
+        id: Uuid::new_v4().to_string(),
+        name: "can_assert_update_missing_item_fails".to_string(),
+        policies: vec![],
+    };
+
+    let result = store.update(&role).await;
+    assert!(matches!(result, Err(Error::Update(_))));
+
+    Ok(())
+}
+
 // Tests that if a user has no policy assigned for the default scenario resource they are denied.
 #[async_std::test]
 async fn can_assert_implicit_deny_no_policy() -> Result<(), Error> {